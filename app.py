@@ -1,14 +1,12 @@
 import streamlit as st
 import streamlit.components.v1 as components
-import yfinance as yf
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from dateutil.relativedelta import relativedelta
-import time
 import json
 import os
+import re
+import threading
 from typing import Dict, List, Optional, Tuple, Any
 import requests
 import pytz
@@ -36,6 +34,35 @@ def add_google_analytics():
 # ✅ 함수 호출 (꼭 필요!)
 add_google_analytics()
 
+# 내부 컬럼명은 고정 ASCII로 통일 (통화 기호가 섞인 한글 컬럼명은 표시 직전에만 생성)
+INT_COLUMNS = ('shares_before', 'new_shares', 'total_shares')
+CURRENCY_COLUMNS = ('div_per_share', 'total_div', 'cum_cash', 'price')
+
+def _display_column_names(currency_symbol: str) -> Dict[str, str]:
+    """내부 ASCII 컬럼명 → 화면/CSV 표시용 한글 컬럼명 매핑"""
+    return {
+        'date': '날짜',
+        'div_per_share': f'주당배당({currency_symbol})',
+        'shares_before': '보유주식',
+        'total_div': f'총배당금({currency_symbol})',
+        'cum_cash': f'누적현금({currency_symbol})',
+        'price': f'주가({currency_symbol})',
+        'new_shares': '신규매수',
+        'total_shares': '총보유주식',
+        'kind': '구분',
+    }
+
+# 배당 주기 → pandas 날짜 오프셋 (모듈 로드시 1회 구성)
+FREQ_TO_OFFSET = {
+    '매월': pd.DateOffset(months=1),
+    '분기': pd.DateOffset(months=3),
+    '반기': pd.DateOffset(months=6),
+    '연간': pd.DateOffset(years=1),
+}
+
+# 티커 형식 (영문/숫자/./-, 10자 이하) - 키 입력마다 재실행되므로 미리 컴파일
+_TICKER_RE = re.compile(r'^[A-Za-z0-9.\-]{1,10}$')
+
 class ValidationError(Exception):
     """사용자 입력 검증 오류"""
     pass
@@ -52,13 +79,14 @@ def validate_inputs(ticker: str, start_date: datetime.date, end_date: datetime.d
         List[str]: 오류 메시지 리스트 (비어있으면 모든 입력이 유효함)
     """
     errors = []
-    
-    # 티커 검증
-    if not ticker or len(ticker.strip()) == 0:
+
+    # 티커 검증 (strip 1회 + 정규식 단일 패스)
+    ticker = ticker.strip() if ticker else ''
+    if not ticker:
         errors.append("❌ 티커를 입력해주세요")
-    elif len(ticker.strip()) > 10:
+    elif len(ticker) > 10:
         errors.append("❌ 티커는 10자 이하여야 합니다")
-    elif not ticker.replace('.', '').replace('-', '').isalnum():
+    elif not _TICKER_RE.fullmatch(ticker):
         errors.append("❌ 티커는 영문, 숫자, '.', '-'만 포함할 수 있습니다")
     
     # 날짜 검증
@@ -82,46 +110,111 @@ def validate_inputs(ticker: str, start_date: datetime.date, end_date: datetime.d
     
     return errors
 
-@st.cache_data(ttl=300, show_spinner=False)  # 5분 캐시
+@st.cache_resource
+def _get_ticker(ticker: str) -> "yf.Ticker":
+    """yf.Ticker 객체 캐시 (세션 재생성 방지)"""
+    import yfinance as yf  # 데이터 조회시에만 로드 (콜드 스타트 단축)
+    return yf.Ticker(ticker)
+
+@st.cache_data(ttl=3600, show_spinner=False)  # 1시간 캐시
+def _get_info(ticker: str) -> Dict[str, Any]:
+    """티커 기본 정보 캐시 조회 (유효성 검사 실패 경로에서만 사용)"""
+    return _get_ticker(ticker).info
+
+# 프로세스 재시작(콜드 스타트) 후에도 유지되는 디스크 캐시
+_DISK_CACHE_DIR = '.cache'
+_DISK_CACHE_TTL = 86400  # 1일 (오늘이 포함된 구간은 종가가 갱신되므로 짧게 유지)
+
+def _history_cache_path(ticker: str, start_date: str, end_date: str) -> str:
+    """티커+기간별 디스크 캐시 파일 경로"""
+    safe_ticker = ticker.upper().replace('.', '_')
+    return os.path.join(_DISK_CACHE_DIR, f"{safe_ticker}_{start_date}_{end_date}.parquet")
+
+@st.cache_data(ttl=3600, show_spinner=False)  # 1시간 캐시
+def _get_history(ticker: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    가격+배당 데이터를 단일 HTTP 요청으로 캐시 조회 (디스크 캐시 우선)
+
+    Raises:
+        DataFetchError: 빈 결과 반환시 (예외는 캐시되지 않으므로 재시도 즉시 가능)
+    """
+    # 디스크 캐시 조회 - 실패시 조용히 네트워크 경로로 폴백
+    path = _history_cache_path(ticker, start_date, end_date)
+    try:
+        if os.path.exists(path) and datetime.now().timestamp() - os.path.getmtime(path) < _DISK_CACHE_TTL:
+            return pd.read_parquet(path)
+    except (OSError, ValueError):
+        pass
+
+    history = _get_ticker(ticker).history(
+        start=start_date, end=end_date, auto_adjust=False, actions=True
+    )
+    if history.empty:
+        # yfinance는 일시 장애에도 빈 프레임을 반환하므로 캐시 대신 예외로 전환
+        # (데이터가 있으면 그 자체가 유효성 증명 → info 조회는 실패 경로에서만)
+        info = _get_info(ticker)
+        if not info or len(info) < 5:  # 기본 정보가 너무 적으면 유효하지 않은 티커
+            raise DataFetchError(f"'{ticker}'는 유효하지 않은 티커입니다.")
+        raise DataFetchError(f"'{ticker}'의 가격 데이터를 찾을 수 없습니다.")
+    history = history[['Close', 'Dividends']]
+
+    # 디스크 캐시 기록 - 쓰기 실패(읽기 전용 파일시스템 등)는 무시
+    try:
+        os.makedirs(_DISK_CACHE_DIR, exist_ok=True)
+        history.to_parquet(path)
+    except (OSError, ImportError):
+        pass
+
+    return history
+
+@st.cache_data(ttl=3600, show_spinner=False)  # 1시간 캐시
+def _download_multi(tickers: Tuple[str, ...], start_date: str, end_date: str) -> pd.DataFrame:
+    """
+    여러 티커의 가격/배당 데이터를 단일 요청으로 병렬 다운로드
+
+    Raises:
+        DataFetchError: 빈 결과 반환시 (예외는 캐시되지 않으므로 재시도 즉시 가능)
+    """
+    import yfinance as yf  # 데이터 조회시에만 로드 (콜드 스타트 단축)
+    data = yf.download(
+        list(tickers), start=start_date, end=end_date,
+        actions=True, auto_adjust=False, group_by='ticker',
+        threads=True, progress=False
+    )
+    # yf.download은 티커별 실패를 삼키고 빈 프레임을 반환하기도 함 → 캐시 대신 예외
+    if data.empty:
+        raise DataFetchError("비교 데이터를 가져오지 못했습니다. 네트워크 연결 또는 티커를 확인해주세요.")
+    return data
+
 def fetch_stock_data(ticker: str, start_date: str, end_date: str) -> Tuple[pd.Series, pd.DataFrame]:
     """
     주식 데이터 가져오기 (배당금 및 가격 데이터)
-    
+
     Args:
         ticker: 주식 티커
         start_date: 시작일 (YYYY-MM-DD)
-        end_date: 종료일 (YYYY-MM-DD)
-        
+        end_date: 종료일 (YYYY-MM-DD, 호출측에서 오늘 이전으로 클램프)
+
     Returns:
         Tuple[pd.Series, pd.DataFrame]: (배당금 데이터, 가격 데이터)
-        
+
     Raises:
         DataFetchError: 데이터 가져오기 실패시
     """
     try:
-        # 네트워크 타임아웃 설정
-        stock = yf.Ticker(ticker)
-        
-        # 기본 정보 확인 (티커 유효성 검사)
-        info = stock.info
-        if not info or len(info) < 5:  # 기본 정보가 너무 적으면 유효하지 않은 티커
-            raise DataFetchError(f"'{ticker}'는 유효하지 않은 티커입니다.")
-        
-        # 배당금 데이터 가져오기
-        dividends = stock.dividends
+        # 가격+배당 데이터를 한 번의 요청으로 가져오기 (캐시 적용, 빈 결과는 예외)
+        hist = _get_history(ticker, start_date, end_date)
+
+        price_data = hist[['Close']]
+        dividends = hist['Dividends']
+        dividends = dividends[dividends > 0]
         if dividends.empty:
             raise DataFetchError(f"'{ticker}'의 배당금 데이터를 찾을 수 없습니다.")
-        
-        # 가격 데이터 가져오기
-        today = datetime.now().date()
-        actual_end = min(today, datetime.strptime(end_date, '%Y-%m-%d').date()).strftime('%Y-%m-%d')
-        
-        price_data = stock.history(start=start_date, end=actual_end)
-        if price_data.empty:
-            raise DataFetchError(f"'{ticker}'의 가격 데이터를 찾을 수 없습니다.")
-        
+
         return dividends, price_data
-        
+
+    except DataFetchError:
+        raise
     except requests.exceptions.RequestException:
         raise DataFetchError("네트워크 연결을 확인해주세요. 인터넷 연결이 불안정합니다.")
     except Exception as e:
@@ -130,288 +223,313 @@ def fetch_stock_data(ticker: str, start_date: str, end_date: str) -> Tuple[pd.Se
         else:
             raise DataFetchError(f"데이터 조회 중 오류가 발생했습니다: {str(e)}")
 
-def analyze_dividend_frequency(dividend_dates: pd.DatetimeIndex) -> Tuple[str, str, relativedelta, float]:
+def analyze_dividend_frequency(dividend_dates: pd.DatetimeIndex) -> Tuple[str, str, float]:
     """
     배당 주기 분석
-    
+
     Args:
         dividend_dates: 배당금 지급일 인덱스
-        
+
     Returns:
-        Tuple[str, str, relativedelta, float]: (주기 단위, 설명, 델타, 평균 간격일)
+        Tuple[str, str, float]: (주기 단위, 설명, 평균 간격일)
     """
     if len(dividend_dates) <= 1:
-        return '매월', '매월 (기본값)', relativedelta(months=1), 30.0
-    
-    # 날짜 간의 평균 간격 계산
-    intervals = []
-    for i in range(1, len(dividend_dates)):
-        interval = (dividend_dates[i] - dividend_dates[i-1]).days
-        intervals.append(interval)
-    
-    avg_interval_days = sum(intervals) / len(intervals)
-    
+        return '매월', '매월 (기본값)', 30.0
+
+    # 날짜 간의 평균 간격 계산 (단일 NumPy diff로 C 레벨 처리)
+    interval_days = np.diff(dividend_dates.values.astype('datetime64[D]').astype(np.int64))
+    avg_interval_days = float(interval_days.mean())
+
     # 배당 주기 판단
     if 25 <= avg_interval_days <= 35:
-        return '매월', '매월', relativedelta(months=1), avg_interval_days
+        return '매월', '매월', avg_interval_days
     elif 80 <= avg_interval_days <= 100:
-        return '분기', '분기별 (3개월)', relativedelta(months=3), avg_interval_days
+        return '분기', '분기별 (3개월)', avg_interval_days
     elif 170 <= avg_interval_days <= 200:
-        return '반기', '반기별 (6개월)', relativedelta(months=6), avg_interval_days
+        return '반기', '반기별 (6개월)', avg_interval_days
     elif 350 <= avg_interval_days <= 380:
-        return '연간', '연간 (12개월)', relativedelta(years=1), avg_interval_days
+        return '연간', '연간 (12개월)', avg_interval_days
     else:
         # 기타 경우 (격월, 불규칙 등)
-        return '매월', f'매월 (실제 간격: {avg_interval_days:.0f}일)', relativedelta(months=1), avg_interval_days
+        return '매월', f'매월 (실제 간격: {avg_interval_days:.0f}일)', avg_interval_days
 
-def find_nearest_price(target_date: pd.Timestamp, price_data: pd.DataFrame, max_days: int = 5) -> Optional[float]:
+def align_dividend_prices(dividends: pd.Series, price_data: pd.DataFrame, max_days: int = 5) -> Tuple[pd.Series, pd.Series]:
     """
-    특정 날짜에 가장 가까운 주가 찾기
-    
+    배당일별 주가를 한 번에 매칭 (벡터화)
+
     Args:
-        target_date: 목표 날짜
+        dividends: 배당금 데이터
         price_data: 가격 데이터
-        max_days: 최대 검색 일수
-        
+        max_days: 최대 허용 간격 일수
+
     Returns:
-        Optional[float]: 찾은 주가 또는 None
+        Tuple[pd.Series, pd.Series]: (주가 매칭된 배당금, 배당일별 주가)
     """
-    price_dates = set(price_data.index)
-    
-    # 정확한 날짜부터 시작해서 앞뒤로 검색
-    for i in range(max_days + 1):
-        # 당일 또는 이후 날짜 확인
-        if i == 0:
-            check_date = target_date
-        else:
-            check_date = target_date + timedelta(days=i)
-        
-        if check_date in price_dates:
-            return price_data.loc[check_date, 'Close']
-            
-        # 이전 날짜 확인
-        if i > 0:
-            check_date = target_date - timedelta(days=i)
-            if check_date in price_dates:
-                return price_data.loc[check_date, 'Close']
-    
-    return None
+    prices = price_data['Close']
+    # 가장 가까운 거래일의 종가를 C 레벨에서 일괄 매칭
+    div_prices = prices.reindex(
+        dividends.index, method='nearest', tolerance=pd.Timedelta(days=max_days)
+    ).dropna()
+    return dividends.loc[div_prices.index], div_prices
+
+def _reinvest_kernel(div_values: np.ndarray, price_values: np.ndarray,
+                     shares0: float, acc0: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, float, float]:
+    """
+    배당 재투자 누적 점화식 커널
+
+    실제/예측 두 단계가 공유하는 핵심 루프. 스칼라 float 연산만 수행하며
+    모든 결과 컬럼 배열을 한 번의 스캔으로 채운다.
 
-def calculate_actual_reinvestment(dividends: pd.Series, price_data: pd.DataFrame, initial_shares: float, ticker: str) -> Tuple[float, float, List[Dict]]:
+    Args:
+        div_values: 회차별 주당 배당금 배열
+        price_values: 회차별 주가 배열
+        shares0: 시작 보유 주식 수
+        acc0: 시작 누적 현금
+
+    Returns:
+        (매수 전 보유주식, 총배당금, 누적현금, 신규매수, 총보유주식, 최종 주식 수, 최종 현금)
+    """
+    n = len(div_values)
+    shares_before = np.empty(n, dtype=np.float64)
+    total_div_arr = np.empty(n, dtype=np.float64)
+    cum_cash_arr = np.empty(n, dtype=np.float64)
+    new_shares_arr = np.empty(n, dtype=np.int64)
+    total_shares_arr = np.empty(n, dtype=np.float64)
+
+    shares = float(shares0)
+    acc = float(acc0)
+
+    for i in range(n):
+        total_dividend = div_values[i] * shares
+        acc += total_dividend
+        new_shares = int(acc // price_values[i])
+
+        if new_shares >= 1:
+            acc -= new_shares * price_values[i]
+            shares += new_shares
+
+        shares_before[i] = shares - new_shares
+        total_div_arr[i] = total_dividend
+        cum_cash_arr[i] = acc
+        new_shares_arr[i] = new_shares
+        total_shares_arr[i] = shares
+
+    return shares_before, total_div_arr, cum_cash_arr, new_shares_arr, total_shares_arr, shares, acc
+
+def calculate_actual_reinvestment(dividends: pd.Series, price_data: pd.DataFrame, initial_shares: float) -> Tuple[float, float, Dict[str, np.ndarray]]:
     """
     실제 배당 데이터를 기반으로 재투자 계산
-    
+
     Args:
         dividends: 배당금 데이터
-        price_data: 가격 데이터  
+        price_data: 가격 데이터
         initial_shares: 초기 보유 주식 수
-        ticker: 주식 티커
-        
+
     Returns:
-        Tuple[float, float, List[Dict]]: (총 주식 수, 누적 현금, 재투자 상세내역)
+        Tuple[float, float, Dict[str, np.ndarray]]: (총 주식 수, 누적 현금, 컬럼별 상세내역)
     """
-    total_shares = float(initial_shares)
-    accumulated_dividends = 0.0
-    reinvestment_details = []
-    
-    # 통화 정보 - 티커를 기준으로 가져오기
-    currency_symbol, _ = get_currency_info(ticker)
-    
-    for div_date, dividend_per_share in dividends.items():
-        div_date_str = div_date.strftime('%Y-%m-%d')
-        
-        # 해당 날짜 주가 찾기
-        price_on_date = find_nearest_price(div_date, price_data)
-        if price_on_date is None:
-            continue
-            
-        # 배당 재투자 계산
-        total_dividend = dividend_per_share * total_shares
-        accumulated_dividends += total_dividend
-        new_shares = int(accumulated_dividends // price_on_date)
-        
-        if new_shares >= 1:
-            accumulated_dividends -= new_shares * price_on_date
-            total_shares += new_shares
-        
-        reinvestment_details.append({
-            '날짜': div_date_str,
-            f'주당배당({currency_symbol})': round(dividend_per_share, 4),
-            '보유주식': round(total_shares - new_shares, 0),
-            f'총배당금({currency_symbol})': round(total_dividend, 2),
-            f'누적현금({currency_symbol})': round(accumulated_dividends, 2),
-            f'주가({currency_symbol})': round(price_on_date, 2),
-            '신규매수': int(new_shares),
-            '총보유주식': round(total_shares, 0),
-            '구분': '실제'
-        })
-    
-    return total_shares, accumulated_dividends, reinvestment_details
+    # 배당일별 주가를 한 번의 벡터 연산으로 매칭 (매칭 실패한 날짜는 제외)
+    aligned_dividends, div_prices = align_dividend_prices(dividends, price_data)
+
+    div_values = aligned_dividends.to_numpy(dtype=np.float64)
+    price_values = div_prices.to_numpy(dtype=np.float64)
+    n = len(div_values)
 
-def calculate_future_forecast(end_date_str: str, dividend_frequency: str, delta: relativedelta,
+    shares_before, total_div_arr, cum_cash_arr, new_shares_arr, total_shares_arr, shares, acc = \
+        _reinvest_kernel(div_values, price_values, float(initial_shares), 0.0)
+
+    # 표시 정밀도(소수 2-4자리)만 필요하므로 float32/int32로 좁혀 메모리 절감
+    columns = {
+        'date': aligned_dividends.index.tz_localize(None).normalize().to_numpy(),
+        'div_per_share': np.round(div_values, 4).astype(np.float32),
+        'shares_before': shares_before.astype(np.int32),
+        'total_div': np.round(total_div_arr, 2).astype(np.float32),
+        'cum_cash': np.round(cum_cash_arr, 2).astype(np.float32),
+        'price': np.round(price_values, 2).astype(np.float32),
+        'new_shares': new_shares_arr.astype(np.int32),
+        'total_shares': total_shares_arr.astype(np.int32),
+        'kind': np.full(n, '실제'),
+    }
+
+    return shares, acc, columns
+
+def calculate_future_forecast(end_ts: pd.Timestamp, dividend_frequency: str,
                             last_dividend: float, current_price: float, total_shares: float,
-                            accumulated_dividends: float, dividend_dates: pd.DatetimeIndex, ticker: str) -> Tuple[float, float, List[Dict]]:
+                            accumulated_dividends: float, dividend_dates: pd.DatetimeIndex) -> Tuple[float, float, Dict[str, np.ndarray]]:
     """
     미래 배당 예측 계산
-    
+
     Args:
-        end_date_str: 종료 날짜 문자열
+        end_ts: 종료 날짜 (파싱 완료된 Timestamp)
         dividend_frequency: 배당 주기
-        delta: 날짜 증가 단위
         last_dividend: 마지막 배당금
         current_price: 현재 주가
         total_shares: 현재 보유 주식 수
         accumulated_dividends: 누적 현금
         dividend_dates: 기존 배당일들
-        ticker: 주식 티커
-        
+
     Returns:
-        Tuple[float, float, List[Dict]]: (최종 주식 수, 최종 누적 현금, 예측 상세내역)
+        Tuple[float, float, Dict[str, np.ndarray]]: (최종 주식 수, 최종 누적 현금, 컬럼별 예측내역)
     """
-    today = datetime.now().date()
-    end_date_obj = datetime.strptime(end_date_str, '%Y-%m-%d').date()
-    
-    if end_date_obj <= today:
-        return total_shares, accumulated_dividends, []
-    
-    forecast_details = []
-    # 통화 정보 - 티커를 기준으로 가져오기
-    currency_symbol, _ = get_currency_info(ticker)
-    
-    # 다음 배당일 계산
+    today = pd.Timestamp(datetime.now().date())
+
+    if end_ts <= today:
+        return total_shares, accumulated_dividends, {}
+
+    # 배당 주기 → pandas 오프셋 (모듈 레벨 딕셔너리 단일 조회)
+    offset = FREQ_TO_OFFSET.get(dividend_frequency, FREQ_TO_OFFSET['매월'])
+
+    # 다음 배당일 계산 (마지막 배당일~오늘 구간을 한 번에 생성해 도출)
     if len(dividend_dates) > 0:
-        last_dividend_date = dividend_dates[-1].date()
-        next_dividend_date = last_dividend_date
-        
-        # 다음 배당일까지 주기만큼 더하기
-        while next_dividend_date <= today:
-            next_dividend_date = next_dividend_date + delta
+        last_dividend_date = pd.Timestamp(dividend_dates[-1].date())
+        if last_dividend_date <= today:
+            next_dividend_date = pd.date_range(last_dividend_date, today, freq=offset)[-1] + offset
+        else:
+            next_dividend_date = last_dividend_date
     else:
-        next_dividend_date = today + delta
-    
-    current_date = next_dividend_date
-    
-    while current_date <= end_date_obj:
-        div_date_str = current_date.strftime('%Y-%m-%d')
-        
-        # 배당 재투자 계산
-        total_dividend = last_dividend * total_shares
-        accumulated_dividends += total_dividend
-        new_shares = int(accumulated_dividends // current_price)
-        
-        if new_shares >= 1:
-            accumulated_dividends -= new_shares * current_price
-            total_shares += new_shares
-        
-        forecast_details.append({
-            '날짜': div_date_str,
-            f'주당배당({currency_symbol})': round(last_dividend, 4),
-            '보유주식': round(total_shares - new_shares, 0),
-            f'총배당금({currency_symbol})': round(total_dividend, 2),
-            f'누적현금({currency_symbol})': round(accumulated_dividends, 2),
-            f'주가({currency_symbol})': round(current_price, 2),
-            '신규매수': int(new_shares),
-            '총보유주식': round(total_shares, 0),
-            '구분': '예측'
-        })
-        
-        current_date += delta
-    
-    return total_shares, accumulated_dividends, forecast_details
+        next_dividend_date = today + offset
+
+    # 미래 배당일 전체를 한 번에 생성
+    future_dates = pd.date_range(next_dividend_date, end_ts, freq=offset)
+    n = len(future_dates)
+    if n == 0:
+        return total_shares, accumulated_dividends, {}
+
+    div = float(last_dividend)
+    price = float(current_price)
+
+    shares_before, total_div_arr, cum_cash_arr, new_shares_arr, total_shares_arr, shares, acc = \
+        _reinvest_kernel(np.full(n, div), np.full(n, price), float(total_shares), float(accumulated_dividends))
+
+    # 표시 정밀도(소수 2-4자리)만 필요하므로 float32/int32로 좁혀 메모리 절감
+    columns = {
+        'date': future_dates.to_numpy(),
+        'div_per_share': np.full(n, round(div, 4), dtype=np.float32),
+        'shares_before': shares_before.astype(np.int32),
+        'total_div': np.round(total_div_arr, 2).astype(np.float32),
+        'cum_cash': np.round(cum_cash_arr, 2).astype(np.float32),
+        'price': np.full(n, round(price, 2), dtype=np.float32),
+        'new_shares': new_shares_arr.astype(np.int32),
+        'total_shares': total_shares_arr.astype(np.int32),
+        'kind': np.full(n, '예측'),
+    }
+
+    return shares, acc, columns
+
+@st.cache_data(ttl=3600, show_spinner=False)  # 동일 입력 재계산 방지 (위젯 상호작용마다 재실행되므로)
+def _run_simulation(ticker: str, start_date: str, end_date: str, initial_shares: int, today_iso: str) -> Optional[Dict[str, Any]]:
+    """
+    시뮬레이션 계산부 (UI 출력 없음 → 결과 캐시 가능)
+
+    Args:
+        ticker: 주식 티커
+        start_date: 시작일 (YYYY-MM-DD)
+        end_date: 종료일 (YYYY-MM-DD)
+        initial_shares: 초기 보유 주식 수
+        today_iso: 오늘 날짜 (캐시 키에 포함해 날짜가 바뀌면 무효화)
+
+    Returns:
+        Optional[Dict]: 시뮬레이션 결과, 기간 내 배당이 없으면 None
+
+    Raises:
+        DataFetchError: 데이터 가져오기 실패시
+    """
+    # 날짜 파싱은 여기서 한 번만 수행하고 하위 함수에는 파싱된 값을 전달
+    today = datetime.strptime(today_iso, '%Y-%m-%d').date()
+    end_date_obj = datetime.strptime(end_date, '%Y-%m-%d').date()
+    # 종료일이 과거면 예측 단계(주기 분석 포함)를 통째로 건너뜀
+    need_forecast = end_date_obj > today
+    actual_end = min(today, end_date_obj).strftime('%Y-%m-%d')
+
+    # 1단계: 데이터 가져오기
+    dividends, price_data = fetch_stock_data(ticker, start_date, actual_end)
+
+    # 해당 기간의 실제 배당 데이터 필터링
+    # 정렬된 DatetimeIndex이므로 불리언 마스크 대신 이진 탐색 슬라이스 사용
+    actual_dividends = dividends.loc[start_date:actual_end]
+
+    if len(actual_dividends) == 0:
+        return None
+
+    # 2단계: 배당 주기 분석 (예측 구간이 있을 때만 필요)
+    if need_forecast:
+        dividend_frequency_unit, dividend_frequency_desc, avg_interval_days = analyze_dividend_frequency(actual_dividends.index)
+    else:
+        dividend_frequency_unit, dividend_frequency_desc, avg_interval_days = '매월', '해당없음 (과거 데이터만)', None
+
+    # 3단계: 실제 데이터로 재투자 계산
+    total_shares, accumulated_dividends, actual_details = calculate_actual_reinvestment(
+        actual_dividends, price_data, initial_shares
+    )
+
+    # 4단계: 미래 예측 계산
+    # iloc[-1]['Close']는 행 Series를 통째로 만들므로 스칼라 접근은 .iat 사용
+    last_dividend = actual_dividends.iat[-1]
+    current_price = price_data['Close'].iat[-1]
+
+    if need_forecast:
+        final_shares, final_cash, forecast_details = calculate_future_forecast(
+            pd.Timestamp(end_date_obj), dividend_frequency_unit, last_dividend, current_price,
+            total_shares, accumulated_dividends, actual_dividends.index
+        )
+    else:
+        final_shares, final_cash, forecast_details = total_shares, accumulated_dividends, {}
+
+    # 5단계: 결과 조합 - 컬럼 배열을 이어붙여 DataFrame을 한 번에 생성
+    if forecast_details:
+        all_columns = {
+            col: np.concatenate([actual_details[col], forecast_details[col]])
+            for col in actual_details
+        }
+    else:
+        all_columns = actual_details
+    df = pd.DataFrame(all_columns)
+    # 구분(kind) 컬럼은 값이 2종뿐이므로 카테고리화 (필터 비교가 int8 연산이 됨)
+    df['kind'] = pd.Categorical(df['kind'], categories=['실제', '예측'])
+
+    return {
+        'final_shares': int(final_shares),
+        'shares_gained': int(final_shares - initial_shares),
+        'remaining_cash': round(final_cash, 2),
+        'dataframe': df,
+        'prediction_assumptions': {
+            'dividend_per_payment': round(last_dividend, 4),
+            'fixed_price': round(current_price, 2),
+            'dividend_frequency': dividend_frequency_desc,
+            'avg_interval_days': round(avg_interval_days, 0) if avg_interval_days is not None and len(actual_dividends.index) > 1 else None
+        },
+        'initial_shares': initial_shares
+    }
 
 def simple_dividend_forecast(ticker: str, start_date: str, end_date: str, initial_shares: int = 1) -> Optional[Dict[str, Any]]:
     """
-    배당 재투자 시뮬레이션 메인 함수 (리팩토링된 버전)
-    
+    배당 재투자 시뮬레이션 메인 함수 (UI 래퍼)
+
+    계산은 캐시된 _run_simulation이 수행하고, 여기서는 스피너 표시와
+    오류 안내만 담당한다.
+
     Args:
         ticker: 주식 티커
         start_date: 시작일 (YYYY-MM-DD)
-        end_date: 종료일 (YYYY-MM-DD)  
+        end_date: 종료일 (YYYY-MM-DD)
         initial_shares: 초기 보유 주식 수
-        
+
     Returns:
         Optional[Dict]: 시뮬레이션 결과 또는 None
     """
-    # 통화 정보 설정
-    currency_symbol, currency_code = get_currency_info(ticker)
-    
-    # 진행 상황 표시
-    progress_bar = st.progress(0)
-    status_text = st.empty()
-    
     try:
-        # 1단계: 데이터 가져오기
-        status_text.text("📊 데이터를 가져오는 중...")
-        progress_bar.progress(20)
-        
-        dividends, price_data = fetch_stock_data(ticker, start_date, end_date)
-        
-        # 해당 기간의 실제 배당 데이터 필터링
-        today = datetime.now().date()
-        actual_end = min(today, datetime.strptime(end_date, '%Y-%m-%d').date()).strftime('%Y-%m-%d')
-        actual_dividends = dividends[(dividends.index >= start_date) & (dividends.index <= actual_end)]
-        
-        if len(actual_dividends) == 0:
+        # 단계별 진행바 대신 스피너 하나만 사용 (진행바 갱신마다 재렌더링 비용 발생)
+        with st.spinner("📊 배당 데이터를 가져와 계산하는 중..."):
+            result = _run_simulation(
+                ticker, start_date, end_date, initial_shares,
+                datetime.now().date().isoformat()
+            )
+
+        if result is None:
             st.warning("⚠️ 해당 기간에 실제 배당 데이터가 없습니다.")
-            return None
-            
-        progress_bar.progress(40)
-        status_text.text("💰 배당 데이터 분석 중...")
-        
-        # 2단계: 배당 주기 분석
-        dividend_frequency_unit, dividend_frequency_desc, delta, avg_interval_days = analyze_dividend_frequency(actual_dividends.index)
-        
-        progress_bar.progress(60)
-        status_text.text("🔄 배당 재투자 계산 중...")
-        
-        # 3단계: 실제 데이터로 재투자 계산 (ticker 파라미터 추가)
-        total_shares, accumulated_dividends, actual_details = calculate_actual_reinvestment(
-            actual_dividends, price_data, initial_shares, ticker
-        )
-        
-        progress_bar.progress(80)
-        status_text.text("🔮 미래 예측 계산 중...")
-        
-        # 4단계: 미래 예측 계산 (ticker 파라미터 추가)
-        last_dividend = actual_dividends.iloc[-1]
-        current_price = price_data.iloc[-1]['Close']
-        
-        final_shares, final_cash, forecast_details = calculate_future_forecast(
-            end_date, dividend_frequency_unit, delta, last_dividend, current_price,
-            total_shares, accumulated_dividends, actual_dividends.index, ticker
-        )
-        
-        progress_bar.progress(100)
-        status_text.text("✅ 계산 완료!")
-        
-        # 5단계: 결과 조합
-        all_details = actual_details + forecast_details
-        df = pd.DataFrame(all_details)
-        
-        result = {
-            'final_shares': int(final_shares),
-            'shares_gained': int(final_shares - initial_shares),
-            'remaining_cash': round(final_cash, 2),
-            'dataframe': df,
-            'prediction_assumptions': {
-                'dividend_per_payment': round(last_dividend, 4),
-                'fixed_price': round(current_price, 2),
-                'dividend_frequency': dividend_frequency_desc,
-                'avg_interval_days': round(avg_interval_days, 0) if len(actual_dividends.index) > 1 else None
-            },
-            'initial_shares': initial_shares
-        }
-        
-        # 잠시 후 진행바 제거
-        time.sleep(1)
-        progress_bar.empty()
-        status_text.empty()
-        
         return result
-        
+
     except DataFetchError as e:
-        progress_bar.empty()
-        status_text.empty()
         st.error(str(e))
         
         # 복구 방안 제시
@@ -432,78 +550,93 @@ def simple_dividend_forecast(ticker: str, start_date: str, end_date: str, initia
         return None
         
     except Exception as e:
-        progress_bar.empty()
-        status_text.empty()
         st.error(f"❌ 예상치 못한 오류가 발생했습니다: {str(e)}")
         st.info("🔄 다시 시도해주세요. 문제가 지속되면 다른 티커로 시도해보세요.")
         return None
 
 
+@st.cache_data(ttl=86400, show_spinner=False)  # 통화는 사실상 변하지 않음
 def get_currency_info(ticker):
     """
     티커 기반으로 통화 정보 반환
     """
-    ticker_upper = ticker.upper()
-    if '.KS' in ticker_upper or '.KQ' in ticker_upper:
+    if ticker.upper().endswith(('.KS', '.KQ')):
         return '₩', 'KRW'
     else:
         return '$', 'USD'
         
+@st.cache_resource
+def _visitor_stats_state() -> Dict[str, Any]:
+    """프로세스 전역 방문자 통계 상태 (Gist GET은 프로세스당 1회)"""
+    return {"stats": None, "lock": threading.Lock()}
+
 def update_visitor_stats():
     """GitHub Gist를 활용한 영구 방문자 통계"""
     # KST 기준으로 오늘 날짜 계산
     kst = pytz.timezone('Asia/Seoul')
     today = datetime.now(kst).strftime("%Y-%m-%d")  # 👈 KST 기준으로 변경
-    
+
     # GitHub Personal Access Token (Streamlit Secrets에 저장)
     github_token = st.secrets.get("GITHUB_TOKEN", None)
     gist_id = st.secrets.get("GIST_ID", None)
-    
+
     if not github_token or not gist_id:
         return 0, 0, today
-    
+
+    state = _visitor_stats_state()
+
     try:
-        # 기존 통계 가져오기
         headers = {"Authorization": f"token {github_token}"}
-        response = requests.get(f"https://api.github.com/gists/{gist_id}", headers=headers)
-        
-        if response.status_code == 200:
-            gist_data = response.json()
-            stats_content = gist_data["files"]["visitor_stats.json"]["content"]
-            stats = json.loads(stats_content)
-        else:
-            # 처음 실행시
-            stats = {"total_visitors": 0, "daily_visitors": {}, "first_visit_date": today}
-        
-        # 세션 중복 방지
-        if "visited_today" not in st.session_state:
-            st.session_state.visited_today = True
-            
-            # 통계 업데이트
-            stats["total_visitors"] += 1
-            if today not in stats["daily_visitors"]:
-                stats["daily_visitors"][today] = 0
-            stats["daily_visitors"][today] += 1
-            
-            # GitHub Gist 업데이트
-            update_data = {
-                "files": {
-                    "visitor_stats.json": {
-                        "content": json.dumps(stats, ensure_ascii=False, indent=2)
+
+        with state["lock"]:
+            # 기존 통계 가져오기 - 메모리에 없을 때만 네트워크 조회
+            if state["stats"] is None:
+                response = requests.get(f"https://api.github.com/gists/{gist_id}", headers=headers)
+
+                if response.status_code == 200:
+                    gist_data = response.json()
+                    stats_content = gist_data["files"]["visitor_stats.json"]["content"]
+                    state["stats"] = json.loads(stats_content)
+                else:
+                    # 처음 실행시
+                    state["stats"] = {"total_visitors": 0, "daily_visitors": {}, "first_visit_date": today}
+
+            stats = state["stats"]
+
+            # 세션 중복 방지 - 새 세션일 때만 카운트/쓰기 발생
+            if "visited_today" not in st.session_state:
+                st.session_state.visited_today = True
+
+                # 통계 업데이트
+                stats["total_visitors"] += 1
+                if today not in stats["daily_visitors"]:
+                    stats["daily_visitors"][today] = 0
+                stats["daily_visitors"][today] += 1
+
+                # GitHub Gist 업데이트 - UI가 응답을 기다리지 않도록 백그라운드 전송
+                update_data = {
+                    "files": {
+                        "visitor_stats.json": {
+                            # 기계가 읽는 파일이므로 들여쓰기 없이 최소 크기로 직렬화
+                            "content": json.dumps(stats, ensure_ascii=False, separators=(',', ':'))
+                        }
                     }
                 }
-            }
-            requests.patch(f"https://api.github.com/gists/{gist_id}", 
-                         headers=headers, 
-                         json=update_data)
-        
-        return stats["total_visitors"], stats["daily_visitors"].get(today, 0), stats.get("first_visit_date", today)
-        
+                threading.Thread(
+                    target=requests.patch,
+                    args=(f"https://api.github.com/gists/{gist_id}",),
+                    kwargs={"headers": headers, "json": update_data},
+                    daemon=True,
+                ).start()
+
+            return stats["total_visitors"], stats["daily_visitors"].get(today, 0), stats.get("first_visit_date", today)
+
     except Exception:
         return 0, 0, today
 
+@st.fragment
 def display_visitor_stats():
-    """방문자 통계 표시"""
+    """방문자 통계 표시 (위젯 상호작용에 따른 전체 재실행에서 분리)"""
     total, today_count, first_date = update_visitor_stats()
     
     if total == 0 and today_count == 0:  # 설정이 안된 경우
@@ -542,7 +675,94 @@ def display_visitor_stats():
         """, unsafe_allow_html=True)
 
 
-        
+@st.cache_data(show_spinner=False)
+def _df_to_csv(df: pd.DataFrame, currency_symbol: str) -> bytes:
+    """CSV 직렬화 캐시 (재실행마다 반복 직렬화 방지, 헤더는 표시용 한글 컬럼명)"""
+    display_df = df.rename(columns=_display_column_names(currency_symbol))
+    return display_df.to_csv(index=False, date_format='%Y-%m-%d').encode('utf-8')
+
+@st.cache_data(show_spinner=False)
+def _build_chart_json(df: pd.DataFrame, ticker: str, frequency_desc: str) -> str:
+    """시뮬레이션 결과 차트를 JSON으로 생성/캐시 (재실행시 파싱만 수행)"""
+    import plotly.graph_objects as go  # 차트 생성시에만 로드 (콜드 스타트 단축)
+
+    # px.line 대신 구분별 Scattergl 트레이스 직접 생성
+    # (WebGL 렌더링 + px의 중간 DataFrame 가공 생략)
+    fig = go.Figure()
+    for kind in df['kind'].cat.categories:
+        part = df.loc[df['kind'] == kind]
+        if part.empty:
+            continue
+        fig.add_trace(go.Scattergl(
+            x=part['date'], y=part['total_shares'], mode='lines', name=kind
+        ))
+
+    fig.update_layout(
+        title=f"{ticker} 배당 재투자 시뮬레이션 ({frequency_desc})",
+        xaxis_title='날짜',
+        yaxis_title='총 보유 주식 (주)',
+        legend_title_text='데이터 구분',
+        hovermode='x unified',
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01
+        )
+    )
+
+    return fig.to_json()
+
+@st.fragment
+def _render_details(df: pd.DataFrame, currency_symbol: str, ticker: str):
+    """상세 내역 테이블 + 필터 (체크박스 변경시 이 블록만 재실행)"""
+    # 필터 옵션
+    col1, col2 = st.columns(2)
+    with col1:
+        show_actual = st.checkbox("실제 데이터 보기", True)
+    with col2:
+        show_forecast = st.checkbox("예측 데이터 보기", True)
+
+    # 데이터 필터링 - 체크박스 조합은 4가지뿐이므로 분기로 직접 선택
+    # (전체/빈 결과는 마스크 없이 즉시, 부분 선택만 카테고리 비교 1회)
+    if show_actual and show_forecast:
+        filtered_df = df
+    elif show_actual:
+        filtered_df = df.loc[df['kind'] == '실제']
+    elif show_forecast:
+        filtered_df = df.loc[df['kind'] == '예측']
+    else:
+        filtered_df = df.iloc[0:0]
+
+    # 숫자는 숫자 그대로 전달하고 포맷/한글 라벨은 column_config로 클라이언트에서 처리
+    # (Styler의 셀별 HTML 생성 비용 제거)
+    names = _display_column_names(currency_symbol)
+    column_config = {
+        'date': st.column_config.DatetimeColumn(names['date'], format='YYYY-MM-DD', alignment='center'),
+        'kind': st.column_config.TextColumn(names['kind'], alignment='center'),
+    }
+    for col in INT_COLUMNS:
+        column_config[col] = st.column_config.NumberColumn(names[col], format='%,d')
+    for col in CURRENCY_COLUMNS:
+        column_config[col] = st.column_config.NumberColumn(names[col], format='%,.2f')
+
+    st.dataframe(
+        filtered_df,
+        use_container_width=True,
+        height=400,
+        hide_index=True,
+        column_config=column_config
+    )
+
+    # CSV 다운로드 (캐시된 직렬화 결과 사용)
+    st.download_button(
+        label="📥 결과를 CSV로 다운로드",
+        data=_df_to_csv(df, currency_symbol),
+        file_name=f"{ticker}_dividend_simulation_{datetime.now().strftime('%Y%m%d')}.csv",
+        mime="text/csv"
+    )
+
+
 # 메인 UI
 def main():
     
@@ -645,11 +865,15 @@ def main():
     # 유효성 검사 통과시에만 버튼 활성화
     button_disabled = any("❌" in error for error in validation_errors)
     
-    if st.button("🚀 배당 재투자 시뮬레이션 시작", 
-                 type="primary", 
+    # 입력값이 같으면 재실행시에도 이전 결과 재사용 (위젯 변경마다 재계산 방지)
+    input_key = (ticker, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'), initial_shares)
+    result = None
+
+    if st.button("🚀 배당 재투자 시뮬레이션 시작",
+                 type="primary",
                  use_container_width=True,
                  disabled=button_disabled):
-        
+
         # 계산 실행
         result = simple_dividend_forecast(
             ticker=ticker,
@@ -657,188 +881,171 @@ def main():
             end_date=end_date.strftime('%Y-%m-%d'),
             initial_shares=initial_shares
         )
-        
+
         if result:
-            # 통화 정보 가져오기
-            currency_symbol, currency_code = get_currency_info(ticker)
-            
-            # 결과 표시
-            st.success("✅ 계산이 완료되었습니다!")
-            
-            # 메트릭 표시
-            st.markdown("## 📊 결과 요약")
-            
-            # 최종 보유 주식 수를 크게 강조
+            st.session_state['last_result'] = (input_key, result)
+
+    if result is None:
+        cached_key, cached_result = st.session_state.get('last_result', (None, None))
+        if cached_key == input_key:
+            result = cached_result
+
+    if result:
+        # 통화 정보 가져오기
+        currency_symbol, currency_code = get_currency_info(ticker)
+        
+        # 결과 표시
+        st.success("✅ 계산이 완료되었습니다!")
+        
+        # 메트릭 표시
+        st.markdown("## 📊 결과 요약")
+
+        # 증가율은 한 번만 계산해 재사용
+        increase_rate = (result['shares_gained'] / result['initial_shares']) * 100
+
+        # 최종 보유 주식 수를 크게 강조
+        st.markdown("""
+        <div style='text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
+                    padding: 2rem; margin: 1rem 0; border-radius: 15px; 
+                    box-shadow: 0 10px 30px rgba(0,0,0,0.2);'>
+            <h2 style='color: white; margin: 0; font-size: 1.5rem; font-weight: 300;'>🎯 최종 보유 주식</h2>
+            <h1 style='color: #FFD700; margin: 0.5rem 0; font-size: 4rem; font-weight: bold; 
+                       text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>{:,}주</h1>
+            <p style='color: #E8F4FD; margin: 0; font-size: 1.2rem; font-weight: 500;'>
+                💎 초기 대비 <span style='color: #FFD700; font-weight: bold;'>+{:,}주</span> 증가 
+                (<span style='color: #00E676; font-weight: bold;'>+{:.1f}%</span>)
+            </p>
+        </div>
+        """.format(
+            result['final_shares'], 
+            result['shares_gained'],
+            increase_rate
+        ), unsafe_allow_html=True)
+        
+        # 나머지 메트릭들
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.metric(
+                "초기 보유", 
+                f"{result['initial_shares']:,}주"
+            )
+        
+        with col2:
+            st.metric(
+                "증가율", 
+                f"{increase_rate:.1f}%"
+            )
+        
+        with col3:
+            st.metric(
+                "잔여 현금", 
+                f"{currency_symbol}{result['remaining_cash']:,.2f}"
+            )
+        
+        # 가정사항 표시
+        st.markdown("## 💡 예측 가정사항")
+        assumptions = result['prediction_assumptions']
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
             st.markdown("""
-            <div style='text-align: center; background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); 
-                        padding: 2rem; margin: 1rem 0; border-radius: 15px; 
-                        box-shadow: 0 10px 30px rgba(0,0,0,0.2);'>
-                <h2 style='color: white; margin: 0; font-size: 1.5rem; font-weight: 300;'>🎯 최종 보유 주식</h2>
-                <h1 style='color: #FFD700; margin: 0.5rem 0; font-size: 4rem; font-weight: bold; 
-                           text-shadow: 2px 2px 4px rgba(0,0,0,0.3);'>{:,}주</h1>
-                <p style='color: #E8F4FD; margin: 0; font-size: 1.2rem; font-weight: 500;'>
-                    💎 초기 대비 <span style='color: #FFD700; font-weight: bold;'>+{:,}주</span> 증가 
-                    (<span style='color: #00E676; font-weight: bold;'>+{:.1f}%</span>)
-                </p>
+            <div style='text-align: center; background-color: #e1f5fe; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #0288d1;'>
+                <h4 style='margin: 0; color: #01579b;'>📅 배당 주기</h4>
+                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold; color: #01579b;'>{}</p>
             </div>
-            """.format(
-                result['final_shares'], 
-                result['shares_gained'], 
-                (result['shares_gained'] / result['initial_shares']) * 100
-            ), unsafe_allow_html=True)
-            
-            # 나머지 메트릭들
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.metric(
-                    "초기 보유", 
-                    f"{result['initial_shares']:,}주"
-                )
-            
-            with col2:
-                increase_rate = (result['shares_gained'] / result['initial_shares']) * 100
-                st.metric(
-                    "증가율", 
-                    f"{increase_rate:.1f}%"
-                )
-            
-            with col3:
-                st.metric(
-                    "잔여 현금", 
-                    f"{currency_symbol}{result['remaining_cash']:,.2f}"
-                )
-            
-            # 가정사항 표시
-            st.markdown("## 💡 예측 가정사항")
-            assumptions = result['prediction_assumptions']
-            col1, col2, col3 = st.columns(3)
-            
-            with col1:
-                st.markdown("""
-                <div style='text-align: center; background-color: #e1f5fe; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #0288d1;'>
-                    <h4 style='margin: 0; color: #01579b;'>📅 배당 주기</h4>
-                    <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold; color: #01579b;'>{}</p>
-                </div>
-                """.format(assumptions['dividend_frequency']), unsafe_allow_html=True)
-            with col2:
-                st.markdown("""
-                <div style='text-align: center; background-color: #e8f5e8; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #4caf50;'>
-                    <h4 style='margin: 0; color: #2e7d32;'>💰 배당금/회</h4>
-                    <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold;color: #2e7d32;'>{}{}</p>
-                </div>
-                """.format(currency_symbol, assumptions['dividend_per_payment']), unsafe_allow_html=True)
-            with col3:
-                st.markdown("""
-                <div style='text-align: center; background-color: #fff3e0; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #ff9800;'>
-                    <h4 style='margin: 0; color: #f57c00;'>📈 고정 주가</h4>
-                    <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold;color: #f57c00;'>{}{}</p>
-                </div>
-                """.format(currency_symbol, assumptions['fixed_price']), unsafe_allow_html=True)
-            
-            # 추가 정보 (실제 간격이 있는 경우)
-            if assumptions['avg_interval_days'] is not None:
-                st.markdown(f"**📊 실제 배당 간격 분석**: 평균 {assumptions['avg_interval_days']:.0f}일")
+            """.format(assumptions['dividend_frequency']), unsafe_allow_html=True)
+        with col2:
+            st.markdown("""
+            <div style='text-align: center; background-color: #e8f5e8; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #4caf50;'>
+                <h4 style='margin: 0; color: #2e7d32;'>💰 배당금/회</h4>
+                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold;color: #2e7d32;'>{}{}</p>
+            </div>
+            """.format(currency_symbol, assumptions['dividend_per_payment']), unsafe_allow_html=True)
+        with col3:
+            st.markdown("""
+            <div style='text-align: center; background-color: #fff3e0; padding: 1rem; border-radius: 0.5rem; border-left: 5px solid #ff9800;'>
+                <h4 style='margin: 0; color: #f57c00;'>📈 고정 주가</h4>
+                <p style='margin: 0.5rem 0 0 0; font-size: 1.1rem; font-weight: bold;color: #f57c00;'>{}{}</p>
+            </div>
+            """.format(currency_symbol, assumptions['fixed_price']), unsafe_allow_html=True)
+        
+        # 추가 정보 (실제 간격이 있는 경우)
+        if assumptions['avg_interval_days'] is not None:
+            st.markdown(f"**📊 실제 배당 간격 분석**: 평균 {assumptions['avg_interval_days']:.0f}일")
+        
+        # 차트 생성
+        df = result['dataframe']
+        if not df.empty:
+            st.markdown("## 📈 보유 주식 수 변화")
             
-            # 차트 생성
-            df = result['dataframe']
-            if not df.empty:
-                st.markdown("## 📈 보유 주식 수 변화")
-                
-                # 날짜를 datetime으로 변환
-                df['날짜_dt'] = pd.to_datetime(df['날짜'])
-                
-                fig = px.line(
-                    df, 
-                    x='날짜_dt', 
-                    y='총보유주식',
-                    color='구분',
-                    title=f"{ticker} 배당 재투자 시뮬레이션 ({assumptions['dividend_frequency']})",
-                    labels={
-                        '날짜_dt': '날짜',
-                        '총보유주식': '총 보유 주식 (주)',
-                        '구분': '데이터 구분'
-                    }
+            import plotly.graph_objects as go  # 결과 렌더링시에만 로드
+
+            fig = go.Figure(json.loads(_build_chart_json(df, ticker, assumptions['dividend_frequency'])))
+            st.plotly_chart(fig, use_container_width=True)
+
+            # 데이터 테이블 (필터 토글시 프래그먼트만 재실행)
+            st.markdown("## 📋 상세 내역")
+            _render_details(df, currency_symbol, ticker)
+    
+    # 여러 티커 비교 모드 (실제 배당 기간 기준)
+    st.markdown("---")
+    with st.expander("🔍 여러 티커 비교 (실제 배당 데이터 기준)"):
+        compare_input = st.text_input(
+            "티커 목록 (쉼표로 구분)",
+            placeholder="예: SCHD, JEPQ, VYM",
+            help="최대 10개까지 한 번에 비교할 수 있습니다"
+        )
+
+        if st.button("📊 비교 실행", use_container_width=True) and compare_input.strip():
+            symbols = tuple(dict.fromkeys(
+                t.strip().upper() for t in compare_input.split(',') if t.strip()
+            ))[:10]
+
+            try:
+                # 빈 다운로드는 _download_multi가 DataFetchError로 전환 (캐시 안 됨)
+                data = _download_multi(
+                    symbols,
+                    start_date.strftime('%Y-%m-%d'),
+                    end_date.strftime('%Y-%m-%d')
                 )
-                
-                fig.update_layout(
-                    hovermode='x unified',
-                    legend=dict(
-                        yanchor="top",
-                        y=0.99,
-                        xanchor="left",
-                        x=0.01
+
+                compare_rows = []
+                for symbol in symbols:
+                    try:
+                        hist = data[symbol]
+                    except KeyError:
+                        continue
+
+                    close = hist['Close'].dropna()
+                    symbol_divs = hist['Dividends']
+                    symbol_divs = symbol_divs[symbol_divs > 0]
+                    if close.empty or symbol_divs.empty:
+                        continue
+
+                    final_shares, _, _ = calculate_actual_reinvestment(
+                        symbol_divs, close.to_frame('Close'), initial_shares
                     )
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                # 데이터 테이블
-                st.markdown("## 📋 상세 내역")
-                
-                # 필터 옵션
-                col1, col2 = st.columns(2)
-                with col1:
-                    show_actual = st.checkbox("실제 데이터 보기", True)
-                with col2:
-                    show_forecast = st.checkbox("예측 데이터 보기", True)
-                
-                # 데이터 필터링
-                filtered_df = df.copy()
-                if not show_actual:
-                    filtered_df = filtered_df[filtered_df['구분'] != '실제']
-                if not show_forecast:
-                    filtered_df = filtered_df[filtered_df['구분'] != '예측']
-                
-                # 날짜_dt 컬럼 제거 (중복이므로)
-                if '날짜_dt' in filtered_df.columns:
-                    filtered_df = filtered_df.drop('날짜_dt', axis=1)
-                
-                # 숫자 형식 지정 및 표시용 데이터프레임 생성
-                display_df = filtered_df.copy()
-                
-                # 숫자 컬럼들에 천의 자리 쉼표 적용
-                numeric_columns = ['보유주식', '신규매수', '총보유주식']
-                currency_columns = [col for col in display_df.columns if currency_symbol in col]
-                
-                for col in numeric_columns:
-                    if col in display_df.columns:
-                        display_df[col] = display_df[col].apply(lambda x: f"{int(x):,}" if pd.notna(x) else "")
-                
-                for col in currency_columns:
-                    if col in display_df.columns:
-                        display_df[col] = display_df[col].apply(lambda x: f"{x:,.2f}" if pd.notna(x) else "")
-                
-                # 스타일링된 데이터프레임 표시
-                styled_df = display_df.style.set_table_styles([
-                    # 날짜와 구분 컬럼 가운데 정렬
-                    {'selector': 'td:nth-child(1)', 'props': [('text-align', 'center')]},  # 날짜
-                    {'selector': 'td:nth-child(9)', 'props': [('text-align', 'center')]},  # 구분 (마지막 컬럼)
-                    # 헤더도 가운데 정렬
-                    {'selector': 'th:nth-child(1)', 'props': [('text-align', 'center')]},  # 날짜 헤더
-                    {'selector': 'th:nth-child(9)', 'props': [('text-align', 'center')]},  # 구분 헤더
-                    # 헤더 스타일
-                    {'selector': 'th', 'props': [('background-color', '#f0f2f6'), ('font-weight', 'bold')]},
-                    # 전체 테이블 스타일
-                    {'selector': 'table', 'props': [('border-collapse', 'collapse'), ('width', '100%')]},
-                    {'selector': 'td, th', 'props': [('border', '1px solid #ddd'), ('padding', '8px')]}
-                ])
-                
-                st.dataframe(
-                    styled_df,
-                    use_container_width=True,
-                    height=400
-                )
-                
-                # CSV 다운로드
-                csv = df.to_csv(index=False, encoding='utf-8')
-                st.download_button(
-                    label="📥 결과를 CSV로 다운로드",
-                    data=csv,
-                    file_name=f"{ticker}_dividend_simulation_{datetime.now().strftime('%Y%m%d')}.csv",
-                    mime="text/csv"
-                )
-    
+                    compare_rows.append({
+                        '티커': symbol,
+                        '배당 횟수': len(symbol_divs),
+                        '최종 보유 주식': int(final_shares),
+                        '증가 주식': int(final_shares) - initial_shares,
+                    })
+
+                if compare_rows:
+                    st.dataframe(pd.DataFrame(compare_rows), use_container_width=True)
+                    st.caption("※ 초기 보유 수량 기준, 기간 내 실제 배당 재투자만 반영 (미래 예측 제외)")
+                else:
+                    st.warning("⚠️ 해당 기간에 배당 데이터가 있는 티커가 없습니다.")
+
+            except DataFetchError as e:
+                st.error(str(e))
+            except requests.exceptions.RequestException:
+                st.error("네트워크 연결을 확인해주세요. 인터넷 연결이 불안정합니다.")
+            except Exception as e:
+                st.error(f"❌ 비교 데이터 조회 중 오류가 발생했습니다: {str(e)}")
+
     # 방문자 통계 표시
     display_visitor_stats()
 